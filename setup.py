@@ -5,7 +5,7 @@ setup(
     version="0.2.4",
     description="Addon to facilitate locating and adding TV series/anime torrents from Toloka/Hurtom with standardized naming for Sonarr/Plex/Jellyfin integration.",
     url="https://github.com/CakesTwix/toloka2MediaServer",
-    packages=find_packages(),
+    packages=find_packages(include=('toloka2MediaServer', 'toloka2MediaServer.*')),
     include_package_data=True,
     package_data={
         'toloka2MediaServer': ['data/*'],
@@ -0,0 +1,31 @@
+import hashlib
+import unittest
+
+from toloka2MediaServer.utils.general import get_info_hash
+
+V1_INFO = b'd6:lengthi3e4:name1:a12:piece lengthi16384e6:pieces20:' + b'\x00' * 20 + b'e'
+
+class GetInfoHashTest(unittest.TestCase):
+    def test_v1_torrent(self):
+        torrent = b'd8:announce3:url4:info' + V1_INFO + b'e'
+        self.assertEqual(get_info_hash(torrent), hashlib.sha1(V1_INFO).hexdigest())
+
+    def test_hybrid_torrent_uses_v1_hash(self):
+        info = b'd6:lengthi3e12:meta versioni2e4:name1:a6:pieces20:' + b'\x00' * 20 + b'e'
+        self.assertEqual(get_info_hash(b'd4:info' + info + b'e'), hashlib.sha1(info).hexdigest())
+
+    def test_info_is_not_a_dictionary(self):
+        self.assertIsNone(get_info_hash(b'd4:info3:abce'))
+        self.assertIsNone(get_info_hash(b'd4:infoli1eee'))
+        self.assertIsNone(get_info_hash(b'd4:infoi1ee'))
+
+    def test_v2_only_torrent(self):
+        info = b'd9:file treede12:meta versioni2e4:name1:a12:piece lengthi16384ee'
+        self.assertIsNone(get_info_hash(b'd4:info' + info + b'e'))
+
+    def test_malformed(self):
+        for torrent in (b'', b'l1:ae', b'd-3:e', b'd4:info', b'd4:infod6:pieces5:abce', b'd8:announce3:url'):
+            self.assertIsNone(get_info_hash(torrent), torrent)
+
+if __name__ == '__main__':
+    unittest.main()
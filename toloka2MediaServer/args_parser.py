@@ -1,5 +1,7 @@
 import argparse
+from functools import lru_cache
 
+@lru_cache(maxsize=1)
 def get_parser():
     # Setup argparse
     parser = argparse.ArgumentParser(description="Console utility for updating torrents from Toloka.")
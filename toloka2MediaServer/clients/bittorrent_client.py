@@ -8,7 +8,7 @@ class BittorrentClient(ABC):
         
     @abstractmethod
     def add_torrent(self, torrents, category, tags, is_paused, download_dir):
-        """Add a new torrent."""
+        """Add a new torrent and return its identifier for get_torrent_info (info-hash or client id, None if unknown)."""
         pass
 
     @abstractmethod
@@ -1,20 +1,23 @@
 import qbittorrentapi
 
 from toloka2MediaServer.clients.bittorrent_client import BittorrentClient
+from toloka2MediaServer.utils.general import get_info_hash
 class QbittorrentClient(BittorrentClient):
     def __init__(self, config):
         """Initialize and log in to the qBittorrent client."""
         try:
             super().__init__()
+            client_config = config.app_config[config.application_config.client]
             self.api_client = qbittorrentapi.Client(
-                host=config.app_config[config.application_config.client]["host"],
-                port=config.app_config[config.application_config.client]["port"],
-                username=config.app_config[config.application_config.client]["username"],
-                password=config.app_config[config.application_config.client]["password"],
+                host=client_config["host"],
+                port=client_config["port"],
+                username=client_config["username"],
+                password=client_config["password"],
             )
             
-            self.category = config.app_config[config.application_config.client]["category"]
-            self.tags = config.app_config[config.application_config.client]["tag"]
+            self.category = client_config["category"]
+            self.tags = client_config["tag"]
+            self.logger = config.logger
             
             self.api_client.auth_log_in()
             config.logger.info("Connected to qBittorrent client successfully.")
@@ -29,10 +32,17 @@ class QbittorrentClient(BittorrentClient):
             raise
     
     def add_torrent(self, torrents, category, tags, is_paused, download_dir):
-        return self.api_client.torrents.add(torrent_files=torrents, category=category, tags=tags, is_paused=is_paused)
+        # qBittorrent only answers "Ok." or "Fails.", so return the info-hash of the added file to look the torrent up directly
+        torrent_hash = get_info_hash(torrents)
+        response = self.api_client.torrents.add(torrent_files=torrents, category=category, tags=tags, is_paused=is_paused)
+        if response != "Ok.":
+            # A refused torrent (e.g. a duplicate) must not be looked up, the newest paused one would be picked instead
+            self.logger.error(f"qBittorrent refused to add the torrent: {response}")
+            raise RuntimeError(f"qBittorrent refused to add the torrent: {response}")
+        return torrent_hash
 
     def get_torrent_info(self, status_filter, category, tags, sort, reverse, torrent_hash=None):
-        return self.api_client.torrents_info(status_filter=status_filter, category=category, tag=tags, sort=sort, reverse=reverse)
+        return self.api_client.torrents_info(status_filter=status_filter, category=category, tag=tags, sort=sort, reverse=reverse, torrent_hashes=torrent_hash)
 
     def get_files(self, torrent_hash):
         return self.api_client.torrents_files(torrent_hash)
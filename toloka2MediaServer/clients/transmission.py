@@ -8,17 +8,18 @@ class TransmissionClient(BittorrentClient):
         """Initialize and log in to the Transmission client."""
         try:
             super().__init__()
+            client_config = config.app_config[config.application_config.client]
             self.api_client = Client(
-                host=config.app_config[config.application_config.client]["host"],
-                port=config.app_config[config.application_config.client]["port"],
-                username=config.app_config[config.application_config.client]["username"],
-                password=config.app_config[config.application_config.client]["password"],
-                path=config.app_config[config.application_config.client]["rpc"],
-                protocol=config.app_config[config.application_config.client]["protocol"],
+                host=client_config["host"],
+                port=client_config["port"],
+                username=client_config["username"],
+                password=client_config["password"],
+                path=client_config["rpc"],
+                protocol=client_config["protocol"],
             )
                         
-            self.category = config.app_config[config.application_config.client]["category"]
-            self.tags = config.app_config[config.application_config.client]["tag"]
+            self.category = client_config["category"]
+            self.tags = client_config["tag"]
             
             config.logger.info(f"Connected to: {config.application_config.client}")
         except TransmissionConnectError:
@@ -1,7 +1,6 @@
 """Here we work with config files and some toloka"""
 import os
 import configparser
-from toloka2python import Toloka
 
 from toloka2MediaServer.models.application import config_to_app
 
@@ -20,6 +19,8 @@ def load_configurations(app_config_path=None, title_config_path=None):
     return app_config, titles_config, application_config
 
 def get_toloka_client(application_config):
+    # Imported here so modules that only need update_config do not pull in toloka2python and its HTTP stack
+    from toloka2python import Toloka
     try:
         # Attempt to create a Toloka client with the provided username and password
         return Toloka(application_config.username, application_config.password)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, fields
 import configparser
 
-@dataclass
+@dataclass(slots=True)
 class Application:
     username: str = ""
     password: str = ""
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 import configparser
 
-@dataclass
+@dataclass(slots=True)
 class Title:
     code_name: str = ""
     episode_index: int = -1
@@ -1,31 +1,97 @@
 """General functions to simplify code"""
+import hashlib
 import re
 
+DIGITS_RE = re.compile(r'\d+')
+TORRENT_NAME_RE = re.compile(r'[\/|]([^\/|\(]+)')
+TORRENT_YEAR_RE = re.compile(r'\((\d{4})\)')
+WHITESPACE_RE = re.compile(r'\s+')
+NON_WORD_RE = re.compile(r'\W+')
+
 def get_numbers(string):
     """Extracts all numbers from a string and returns them as a list."""
-    return [i for i in ''.join((ch if ch.isdigit() else ' ') for ch in string).split()]
+    return DIGITS_RE.findall(string)
 
 def replace_second_part_in_path(path, name):
     """Replaces the second part of a path with a new name."""
-    parts = path.split("/")
-    if len(parts) > 1:
-        parts[1] = name
-    return "/".join(parts)
+    head, sep, rest = path.partition("/")
+    if not sep:
+        return path
+    _, sep, tail = rest.partition("/")
+    return f"{head}/{name}{sep}{tail}"
 
 def get_folder_name_from_path(path):
     """Extracts the folder name from a path."""
-    return path.split("/")[0] if "/" in path else ""
+    head, sep, _ = path.partition("/")
+    return head if sep else ""
+
+def replace_spaces_with_dots(name):
+    """Replaces every run of whitespace in a name with a single dot."""
+    return WHITESPACE_RE.sub('.', name)
 
 def extract_torrent_details(torrent_name):
-    matched_name = re.search(r'[\/|]([^\/|\(]+)', torrent_name)
-    matched_year = re.search(r'\((\d{4})\)', torrent_name)
+    matched_name = TORRENT_NAME_RE.search(torrent_name)
+    matched_year = TORRENT_YEAR_RE.search(torrent_name)
     
     if matched_name:
         suggested_name = f"{matched_name.group(1)} ({matched_year.group(1) if matched_year else ""})".strip()
-        suggested_name = re.sub(r'\s+', ' ', suggested_name)
-        suggested_codename = re.sub(r'\W+', '', matched_name.group(1)).strip()
+        suggested_name = WHITESPACE_RE.sub(' ', suggested_name)
+        suggested_codename = NON_WORD_RE.sub('', matched_name.group(1)).strip()
     else:
         suggested_name = "No match found"
         suggested_codename = "No match found"
     
-    return suggested_name, suggested_codename
\ No newline at end of file
+    return suggested_name, suggested_codename
+
+def _bencode_end(data, index):
+    """Returns the index right after the bencoded value that starts at index, raises ValueError if it is malformed."""
+    token = data[index:index + 1]
+    if token in (b'd', b'l'):
+        index += 1
+        while data[index:index + 1] != b'e':
+            if index >= len(data):
+                raise ValueError("Unterminated bencoded list or dictionary")
+            index = _bencode_end(data, index)
+        return index + 1
+    if token == b'i':
+        return data.index(b'e', index) + 1
+    colon = data.index(b':', index)
+    length = data[index:colon]
+    # bytes.isdigit only accepts ASCII digits, so negative or empty lengths cannot stall the walk
+    if not length.isdigit():
+        raise ValueError("Invalid bencoded string length")
+    end = colon + 1 + int(length)
+    if end > len(data):
+        raise ValueError("Bencoded string runs past the end of data")
+    return end
+
+def _bencode_dict_items(data, index):
+    """Yields (raw key, value start, value end) for each entry of the bencoded dictionary that starts at index."""
+    index += 1
+    while data[index:index + 1] != b'e':
+        if index >= len(data):
+            raise ValueError("Unterminated bencoded dictionary")
+        key_end = _bencode_end(data, index)
+        value_end = _bencode_end(data, key_end)
+        yield data[index:key_end], key_end, value_end
+        index = value_end
+
+def get_info_hash(torrent_file):
+    """Calculates the v1 info-hash of bencoded .torrent content, or None if it is malformed, has no info dictionary or is v2-only."""
+    if torrent_file[:1] != b'd':
+        return None
+    try:
+        for key, value_start, value_end in _bencode_dict_items(torrent_file, 0):
+            if key != b'4:info':
+                continue
+            if torrent_file[value_start:value_start + 1] != b'd':
+                return None
+            info_keys = {info_key for info_key, _, _ in _bencode_dict_items(torrent_file, value_start)}
+            # v2-only torrents ("meta version" 2 without "pieces") are identified by a SHA-256 hash instead
+            if b'6:pieces' not in info_keys:
+                return None
+            # Hash the original bytes, re-encoding the decoded dictionary could change them
+            return hashlib.sha1(torrent_file[value_start:value_end]).hexdigest()
+    except (ValueError, RecursionError):
+        return None
+    return None
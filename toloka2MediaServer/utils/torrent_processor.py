@@ -6,7 +6,56 @@ from toloka2MediaServer.clients.bittorrent_client import BittorrentClient
 from toloka2MediaServer.config_parser import update_config
 from toloka2MediaServer.models.operation_result import OperationResult
 from toloka2MediaServer.models.title import Title, title_to_config
-from toloka2MediaServer.utils.general import get_numbers, replace_second_part_in_path, get_folder_name_from_path
+from toloka2MediaServer.utils.general import get_numbers, replace_second_part_in_path, get_folder_name_from_path, replace_spaces_with_dots
+
+def wait_for_added_torrent(config, category, tag, torrent_hash):
+    """ Polls qBittorrent until the paused torrent shows up, for at most client_wait_time seconds """
+    if not torrent_hash:
+        # Without a hash the newest paused torrent is picked, so give the client the full wait before looking
+        time.sleep(config.application_config.client_wait_time)
+        return config.client.get_torrent_info(status_filter='paused', category=category, tags=tag, sort="added_on", reverse=True)
+
+    deadline = time.monotonic() + config.application_config.client_wait_time
+    delay = 0.05
+    while True:
+        filtered_torrents = config.client.get_torrent_info(status_filter='paused', category=category, tags=tag, sort="added_on", reverse=True, torrent_hash=torrent_hash)
+        if filtered_torrents:
+            return filtered_torrents
+        if time.monotonic() >= deadline:
+            # The client may list the torrent under another hash (e.g. v2), so fall back to the newest paused one
+            config.logger.warning(f"Torrent {torrent_hash} did not show up in qBittorrent, using the newest paused torrent instead")
+            return config.client.get_torrent_info(status_filter='paused', category=category, tags=tag, sort="added_on", reverse=True)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+def prompt_episode_index(title, file_name):
+    """ Asks the user which number in file_name is the episode and how to adjust it, and stores both in title """
+    # Extract numbers from the filename
+    numbers = get_numbers(file_name)
+    
+    # Display the numbers to the user, starting count from 1
+    print(f"{file_name}\nEnter the order number of the episode index from the list below:")
+    for index, number in enumerate(numbers, start=1):
+        print(f"{index}: {number}")
+
+    # Get user input and adjust for 0-based index
+    episode_order = int(input("Your choice (use order number): "))
+    episode_index = episode_order - 1  # Convert to 0-based index
+    source_episode_number = numbers[episode_index]
+    print(f"You selected episode number: {numbers[episode_index]}")
+
+    adjustment_input = input("Enter the adjustment value (e.g., '+9' or '-3', default is 0): ").strip()
+    adjusted_episode_number = int(adjustment_input) if adjustment_input else 0
+    
+    if adjusted_episode_number != 0:
+        # Calculate new episode number considering adjustment and preserve leading zeros if any
+        adjusted_episode = str(int(source_episode_number) + adjusted_episode_number).zfill(len(source_episode_number))
+    else:
+        adjusted_episode = source_episode_number
+    print(f"Adjusted episode number: {adjusted_episode}")
+    
+    title.episode_index = episode_index
+    title.adjusted_episode_number = adjusted_episode_number
 
 def process_torrent(config, title, torrent, new=False):
     """ Common logic to process torrents, either updating or adding new ones """
@@ -16,11 +65,15 @@ def process_torrent(config, title, torrent, new=False):
         
     category = config.client.category
     tag = config.client.tags
+    is_qbittorrent = config.application_config.client == "qbittorrent"
     
     add_torrent_response = config.client.add_torrent(torrents=tolokaTorrentFile, category=category, tags=[tag], is_paused=True, download_dir=title.download_dir)
-    time.sleep(config.application_config.client_wait_time)
-    if config.application_config.client == "qbittorrent":
-        filtered_torrents = config.client.get_torrent_info(status_filter='paused', category=category, tags=tag, sort="added_on", reverse=True)
+    if is_qbittorrent:
+        filtered_torrents = wait_for_added_torrent(config, category, tag, add_torrent_response)
+        if not filtered_torrents:
+            message = f"Added torrent {add_torrent_response or torrent.name} not found in qBittorrent"
+            config.logger.error(message)
+            raise RuntimeError(message)
         added_torrent = filtered_torrents[0]
         title.hash = added_torrent.info.hash
         get_filelist = config.client.get_files(title.hash)
@@ -37,51 +90,33 @@ def process_torrent(config, title, torrent, new=False):
     if new:
         
         title.guid = torrent.url
-        # Extract numbers from the filename
-        numbers = get_numbers(first_fileName)
         
         if title.episode_index == -1:
-            # Display the numbers to the user, starting count from 1
-            print(f"{first_fileName}\nEnter the order number of the episode index from the list below:")
-            for index, number in enumerate(numbers, start=1):
-                print(f"{index}: {number}")
-
-            # Get user input and adjust for 0-based index
-            episode_order = int(input("Your choice (use order number): "))
-            episode_index = episode_order - 1  # Convert to 0-based index
-            source_episode_number = numbers[episode_index]
-            print(f"You selected episode number: {numbers[episode_index]}")
-        
-            adjustment_input = input("Enter the adjustment value (e.g., '+9' or '-3', default is 0): ").strip()
-            adjusted_episode_number = int(adjustment_input) if adjustment_input else 0
-            
-            if adjusted_episode_number != 0:
-                # Calculate new episode number considering adjustment and preserve leading zeros if any
-                adjusted_episode = str(int(source_episode_number) + adjusted_episode_number).zfill(len(source_episode_number))
-            else:
-                adjusted_episode = source_episode_number
-            print(f"Adjusted episode number: {adjusted_episode}")
-            
-            title.episode_index = episode_index
-            title.adjusted_episode_number = adjusted_episode_number
+            # Callers that already know the episode index (e.g. add by url) never reach the interactive prompt
+            prompt_episode_index(title, first_fileName)
     
+    # Only the episode number changes between files, so build the rest of the name once
+    if config.application_config.enable_dot_spacing_in_file_name:
+        # Use dots as separators and no hyphen
+        name_prefix = f"{title.torrent_name}.S{title.season_number}E"
+        name_suffix = f".{title.meta}.{title.release_group}{title.ext_name}"
+        # Just in case replace spaces if any in name, meta or release group
+        name_prefix = replace_spaces_with_dots(name_prefix)
+        name_suffix = replace_spaces_with_dots(name_suffix)
+    else:
+        # Use spaces as separators and a hyphen before release_group
+        name_prefix = f"{title.torrent_name} S{title.season_number}E"
+        name_suffix = f" {title.meta}-{title.release_group}{title.ext_name}"
+
     for file in get_filelist:
         if title.ext_name not in file.name:
             continue
         
         source_episode = get_numbers(file.name)[title.episode_index]
         calculated_episode = str(int(source_episode) + title.adjusted_episode_number).zfill(len(source_episode))
+        new_name = f"{name_prefix}{calculated_episode}{name_suffix}"
 
-        if config.application_config.enable_dot_spacing_in_file_name:
-            # Use dots as separators and no hyphen
-            new_name = f"{title.torrent_name}.S{title.season_number}E{calculated_episode}.{title.meta}.{title.release_group}{title.ext_name}"
-            # Just in case replace spaces if any in name, meta or release group
-            new_name = new_name.replace("  ", ".").replace(" ", ".")
-        else:
-            # Use spaces as separators and a hyphen before release_group
-            new_name = f"{title.torrent_name} S{title.season_number}E{calculated_episode} {title.meta}-{title.release_group}{title.ext_name}"
-
-        if config.application_config.client == "qbittorrent":
+        if is_qbittorrent:
             new_path = replace_second_part_in_path(file.name, new_name)
         else:
             new_path = new_name
@@ -89,7 +124,7 @@ def process_torrent(config, title, torrent, new=False):
 
     folderName = f"{title.torrent_name} S{title.season_number} {title.meta}[{title.release_group}]"
     if config.application_config.enable_dot_spacing_in_file_name:
-        folderName = folderName.replace("  ", ".").replace(" ", ".")
+        folderName = replace_spaces_with_dots(folderName)
 
     old_path = get_folder_name_from_path(first_fileName)
     config.client.rename_folder(torrent_hash=title.hash, old_path=old_path, new_path=folderName)